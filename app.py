@@ -1,3 +1,10 @@
+import logging
+from core.paths import LOG_FILE_STR
+# Configure the root logger before importing the rest of the app, whose
+# modules would otherwise install their own handler first
+if not logging.getLogger().handlers:
+    logging.basicConfig(filename=LOG_FILE_STR, level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
+
 from textual.app import App, ComposeResult
 from workspace.workspace import Workspace
 import sys
@@ -10,11 +17,9 @@ from ui.side_view import SideView
 from ui.confirm_exit import ConfirmExit
 from ui.folder_view import FolderView
 from ui.ai_view import AIView
-import logging
 import os
 from textual import events
-from core.paths import LOG_FILE_STR, CSS_PATH_STR
-logging.basicConfig(filename=LOG_FILE_STR, level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
+from core.paths import CSS_PATH_STR
 
 # Run with: python app.py
 
@@ -133,8 +138,8 @@ class TextualApp(App):
     # def on_tab_message(self, event: TabMessage):
     #     if event.is_forwarded:
     #         self.screen.focus_next()
-    def on_save_all_files(self, event: SaveAllFiles):
-        self.workspace.save_all_files()
+    async def on_save_all_files(self, event: SaveAllFiles):
+        await self.workspace.save_all_files()
         quit()
 
     def on_select_ai_event(self, event: SelectAIEvent):
@@ -166,6 +171,8 @@ class TextualApp(App):
             editor = self.workspace.tab_manager.get_active_editor()
             if editor and hasattr(editor, 'code_area') and editor.code_area:
                 editor.code_area.load_text_silent(event.new_content)
+                # load_text_silent doesn't post Changed, so flag the tab here
+                self.workspace.tab_manager.dirty_label(editor.tab_id)
                 logging.info("Applied AI changes to editor")
         except Exception as e:
             logging.error(f"Error applying AI changes: {e}")
@@ -8,6 +8,9 @@ This module provides:
 
 import json
 import logging
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -40,6 +43,23 @@ DEFAULT_KEYBINDINGS = {
 CONFIG_DIR = Path.home() / ".config" / "mt-code"
 KEYBINDINGS_FILE = CONFIG_DIR / "keybindings.json"
 
+# Placeholders available in bash keybindings
+_PLACEHOLDER_RE = re.compile(r"%(file|dir)%")
+
+
+@lru_cache(maxsize=128)
+def _has_placeholders(command: str) -> bool:
+    """Whether a bash keybinding uses any placeholder (checked once per command)."""
+    return _PLACEHOLDER_RE.search(command) is not None
+
+
+def expand_placeholders(command: str, file_path: str) -> str:
+    """Substitute %file% and %dir% in a bash keybinding in a single pass."""
+    if not _has_placeholders(command):
+        return command
+    values = {"file": file_path, "dir": os.path.dirname(file_path) or "."}
+    return _PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], command)
+
 
 class KeybindingsManager:
     """Manages keybindings for the application."""
@@ -6,6 +6,9 @@ This module provides:
 - List of supported languages
 """
 
+import os
+from functools import lru_cache
+
 # Map file extensions to language names (must match tree-sitter language names)
 EXTENSION_TO_LANGUAGE = {
     # Python
@@ -251,6 +254,9 @@ FILENAME_TO_RUN_COMMAND = {
     "Dockerfile": "docker build -f {file} .",
 }
 
+# Extensions whose run command uses the configured Python interpreter
+_PYTHON_EXTENSIONS = frozenset({".py", ".pyw"})
+
 
 def get_run_command(file_path: str) -> str | None:
     """
@@ -262,11 +268,8 @@ def get_run_command(file_path: str) -> str | None:
     Returns:
         Run command with {file} placeholder, or None if unknown
     """
-    from pathlib import Path
-
-    path = Path(file_path)
-    filename = path.name
-    extension = path.suffix.lower()
+    filename = os.path.basename(file_path)
+    extension = os.path.splitext(filename)[1].lower()
 
     # Check filename first
     if filename in FILENAME_TO_RUN_COMMAND:
@@ -277,13 +280,34 @@ def get_run_command(file_path: str) -> str | None:
         cmd = EXTENSION_TO_RUN_COMMAND[extension]
 
         # For Python files, use configured interpreter
-        if extension in [".py", ".pyw"]:
+        # (not cacheable per extension: the interpreter can change at runtime)
+        if extension in _PYTHON_EXTENSIONS:
             from core.python_config import get_python_config
             python_config = get_python_config()
-            working_dir = str(path.parent)
+            working_dir = os.path.dirname(file_path) or "."
             interpreter = python_config.get_effective_interpreter(working_dir)
             cmd = f"{interpreter} {{file}}"
 
         return cmd
 
     return None
+
+
+@lru_cache(maxsize=64)
+def _split_run_template(template: str) -> tuple[str, ...]:
+    """Split a run command template around its {file} placeholders (once per template)."""
+    return tuple(template.split("{file}"))
+
+
+def format_run_command(template: str, file_path: str) -> str:
+    """
+    Fill the {file} placeholder of a run command template.
+
+    Args:
+        template: Run command as returned by get_run_command
+        file_path: Path to the file being run
+
+    Returns:
+        The command to send to the terminal
+    """
+    return file_path.join(_split_run_template(template))
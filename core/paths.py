@@ -15,6 +15,7 @@ HIGHLIGHT_DIR = BASE_DIR / "language_highlighting"
 CSS_PATH = BASE_DIR / "config" / "app.tcss"
 
 # Convert to strings for compatibility
+BASE_DIR_STR = str(BASE_DIR)
 LOG_FILE_STR = str(LOG_FILE)
 HIGHLIGHT_DIR_STR = str(HIGHLIGHT_DIR)
 CSS_PATH_STR = str(CSS_PATH)
@@ -35,6 +35,8 @@ class Session:
         self.session_file = self.session_dir / self.SESSION_FILE
         self._data: Dict[str, Any] = {}
         self._load()
+        # Tab state as last read from / written to disk, to skip no-op saves
+        self._last_persisted_tabs = (tuple(self.get_tab_paths()), self.get_active_tab_path())
 
     def _ensure_session_dir(self):
         """Create the .mt-code directory if it doesn't exist."""
@@ -128,15 +130,20 @@ class Session:
             tab_paths: List of file paths for open tabs
             active_path: Path of the currently active tab
         """
+        state = (tuple(tab_paths), active_path)
+        if state == self._last_persisted_tabs:
+            return
         tabs = []
         for path in tab_paths:
             tabs.append({
                 "file_path": path,
                 "is_active": path == active_path
             })
-        self.set_open_tabs(tabs)
+        # Set both keys before writing so the state hits disk once
+        self.set("open_tabs", tabs)
         self.set_active_tab_path(active_path)
         self.save()
+        self._last_persisted_tabs = state
 
     def get_tab_paths(self) -> List[str]:
         """Get just the file paths of open tabs.
@@ -151,3 +158,4 @@ class Session:
         """Clear all session data."""
         self._data = {}
         self.save()
+        self._last_persisted_tabs = ((), None)
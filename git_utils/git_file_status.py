@@ -3,14 +3,7 @@ from git import Repo
 
 def get_file_git_status(repo: Repo, file_path: str):
     """Return status: 'modified', 'staged', 'untracked', 'clean'"""
-    file_path = Path(file_path).resolve()
-    repo_path = Path(repo.working_tree_dir).resolve()
-
-    try:
-        rel_path = file_path.relative_to(repo_path).as_posix()
-    except ValueError:
-        # file is outside repo? fallback to name
-        rel_path = file_path.name
+    rel_path = repo_relative_path(repo, file_path)
 
     if rel_path in repo.untracked_files:
         return "U"
@@ -21,6 +14,45 @@ def get_file_git_status(repo: Repo, file_path: str):
     else:
         return ""
 
+def get_repo_porcelain_status(repo: Repo) -> dict[str, str]:
+    """Return {repo-relative posix path: XY code} from one `git status --porcelain -z` call."""
+    output = repo.git.status(porcelain=True, z=True, untracked_files="all")
+    statuses = {}
+    entries = output.split("\x00")
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        xy, path = entry[:2], entry[3:]
+        statuses[path] = xy
+        # Renames/copies are followed by the original path as a separate entry
+        if xy[0] in "RC":
+            i += 1
+    return statuses
+
+def status_from_porcelain(xy: str):
+    """Map a porcelain XY code to the same letters as get_file_git_status."""
+    if xy == "??":
+        return "U"
+    elif xy[1] != " ":
+        return "M"
+    elif xy[0] != " ":
+        return "S"
+    else:
+        return ""
+
+def repo_relative_path(repo: Repo, file_path: str):
+    """Return file_path relative to the repo's working tree as a posix path."""
+    file_path = Path(file_path).resolve()
+    repo_path = Path(repo.working_tree_dir).resolve()
+    try:
+        return file_path.relative_to(repo_path).as_posix()
+    except ValueError:
+        # file is outside repo? fallback to name
+        return file_path.name
+
 if __name__ == "__main__":
     # Open the repo at the working tree folder, not the .git folder
     repo = Repo(".")  # or Repo("/home/juxtaa/coding/mt-code")
@@ -171,6 +171,15 @@ class EditorView(Container):
         self.post_message(UseFile(file_path))
     async def on_key(self, event: Key):
         pass
+    @property
+    def is_empty(self) -> bool:
+        """True if the buffer is blank, checked line by line without building the full text."""
+        code_area = getattr(self, "code_area", None)
+        if code_area is None:
+            # Not mounted yet, so nothing has been loaded or typed
+            return True
+        document = code_area.document
+        return all(not document.get_line(i).strip() for i in range(document.line_count))
     def undo(self):
         self.code_area.undo()
     def redo(self):
@@ -0,0 +1,16 @@
+from ui.overlay import Overlay
+from textual.widgets import LoadingIndicator, Static
+from textual.events import Key
+class ProgressOverlay(Overlay):
+    """Overlay shown while a long-running operation (e.g. a git push) is in progress."""
+    def __init__(self, message, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.message = message
+
+    def on_mount(self):
+        super().on_mount()
+        self.mount(Static(self.message, classes="success_message"))
+        self.mount(LoadingIndicator())
+    def on_key(self, event: Key):
+        # Stays up until the operation finishes; don't close on escape
+        pass
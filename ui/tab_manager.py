@@ -9,8 +9,9 @@ This module provides the TabManager class which handles:
 
 from textual.containers import Container, Horizontal, HorizontalScroll
 from textual.widgets import Button
-from pathlib import Path
+from textual.timer import Timer
 import logging
+import os
 
 from ui.editor_view import EditorView
 from ui.tab import Tab
@@ -22,7 +23,8 @@ from commands.messages import (
 )
 from git import Repo
 from git_utils import git_file_status
-from core.paths import LOG_FILE_STR
+from core.paths import LOG_FILE_STR, BASE_DIR_STR
+from functools import lru_cache
 
 logging.basicConfig(
     filename=LOG_FILE_STR,
@@ -31,6 +33,17 @@ logging.basicConfig(
 )
 
 
+@lru_cache(maxsize=256)
+def _make_relative(base_dir: str, full_path: str) -> str:
+    """Tab label for full_path relative to base_dir (cached - labels recur often)."""
+    full_path = os.path.realpath(full_path)
+    if full_path == base_dir:
+        return "."
+    if full_path.startswith(base_dir.rstrip(os.sep) + os.sep):
+        return full_path[len(base_dir.rstrip(os.sep)) + 1:]
+    return os.path.basename(full_path)
+
+
 class TabManager(TabNavigationMixin, Container):
     """Manages editor tabs and the tab bar UI."""
 
@@ -40,8 +53,25 @@ class TabManager(TabNavigationMixin, Container):
         self.repo = repo
         self.session = session
         self.initial_active_tab_id = active_tab_id  # Tab to activate on mount
-        # Keep an ordered list of currently mounted tab ids (strings)
-        self.tab_order: list[str] = []
+        self.active_tab: str | None = None
+        # Editor of the active tab, kept in sync whenever the active tab changes
+        self.active_editor: EditorView | None = None
+        # Currently mounted tab ids (strings) in insertion order; a dict gives
+        # O(1) membership tests and removal while keeping the order
+        self.tab_order: dict[str, None] = {}
+        # Tab buttons keyed by tab id, and the one currently shown as selected
+        self.tab_buttons: dict[str, Tab] = {}
+        self._active_button: Tab | None = None
+        # Resolved file path -> tab id, and the reverse, so finding an open
+        # file's tab doesn't resolve every tab's path
+        self._path_to_tab: dict[str, str] = {}
+        self._tab_paths: dict[str, str] = {}
+        # `git status --porcelain` output ({repo-relative path: XY}), held
+        # only while on_mount builds the initial tab buttons
+        self._porcelain: dict[str, str] | None = None
+        # Debounced session writes: bursts of tab changes become one write
+        self._session_dirty = False
+        self._session_timer: Timer | None = None
         # Monotonic counter for allocating new tab ids within a session
         self.next_tab_id = 0
         logging.info(f"TabManager initialized with {len(tabs)} tabs")
@@ -50,19 +80,33 @@ class TabManager(TabNavigationMixin, Container):
 
     def make_relative(self, full_path: str) -> str:
         """Convert a full path to a relative path from project root."""
-        full_path = Path(full_path).resolve()
-        base_dir = Path(__file__).parent.parent.resolve()
+        return _make_relative(BASE_DIR_STR, full_path)
+
+    # === Git Status ===
+
+    def refresh_git_status(self):
+        """Query git once for the status of every changed file in the repo."""
         try:
-            return str(full_path.relative_to(base_dir))
-        except ValueError:
-            return full_path.name
+            self._porcelain = git_file_status.get_repo_porcelain_status(self.repo)
+        except Exception:
+            logging.exception("Failed to read git status")
+            self._porcelain = {}
+
+    def get_git_status(self, file_path: str) -> str:
+        """Return the git status letter for a file.
+
+        Uses the batched porcelain output while it's held (during on_mount),
+        otherwise asks git directly so later tabs never see stale status.
+        """
+        if self._porcelain is None:
+            return git_file_status.get_file_git_status(self.repo, file_path)
+        rel_path = git_file_status.repo_relative_path(self.repo, file_path)
+        return git_file_status.status_from_porcelain(self._porcelain.get(rel_path, "  "))
 
     # === Tab Bar Management ===
 
-    def add_to_tab_bar(self, tab_id: str, editor: EditorView):
-        """Add a tab button to the tab bar."""
-        if tab_id not in self.tabs:
-            return
+    def _build_tab_button(self, tab_id: str, editor: EditorView) -> Tab:
+        """Create (but don't mount) the tab button for an editor."""
         logging.info("add_tab_to_bar thinks editor.filepath = " + str(editor.file_path))
         logging.info("add_tab_to_bar thinks tab_id = " + tab_id)
 
@@ -72,22 +116,27 @@ class TabManager(TabNavigationMixin, Container):
             else:
                 tab_title = editor.file_path
             if self.repo:
-                status = git_file_status.get_file_git_status(self.repo, editor.file_path)
+                status = self.get_git_status(editor.file_path)
                 tab_title = tab_title + " " + status
             tab_button = Tab(saved=True, label=str(tab_title), id="t" + tab_id, classes="tab_button")
         else:
             tab_button = Tab(saved=False, label="unsaved", id="t" + tab_id, classes="tab_button")
+        return tab_button
+
+    def add_to_tab_bar(self, tab_id: str, editor: EditorView):
+        """Add a tab button to the tab bar."""
+        if tab_id not in self.tabs:
+            return
+        tab_button = self._build_tab_button(tab_id, editor)
         self.tab_bar.mount(tab_button)
-        if tab_id not in self.tab_order:
-            self.tab_order.append(tab_id)
+        self.tab_buttons[tab_id] = tab_button
+        self.tab_order.setdefault(tab_id, None)
 
     def remove_from_tab_bar(self, tab_id: str):
         """Remove a tab button from the tab bar."""
-        button = None
-        for child in list(self.tab_bar.children):
-            if isinstance(child, Button) and child.id == f"t{tab_id}":
-                button = child
-                break
+        button = self.tab_buttons.pop(tab_id, None)
+        if button is self._active_button:
+            self._active_button = None
         if button:
             button.remove()
 
@@ -95,9 +144,7 @@ class TabManager(TabNavigationMixin, Container):
 
     def get_active_editor(self) -> EditorView | None:
         """Return the currently active editor."""
-        if self.active_tab is None:
-            return None
-        return self.tabs.get(self.active_tab)
+        return self.active_editor
 
     def get_next_tab_id(self):
         """Get the next available tab ID."""
@@ -105,21 +152,29 @@ class TabManager(TabNavigationMixin, Container):
         self.next_tab_id += 1
         return nid
 
-    def find_tab_by_path(self, file_path: str) -> str | None:
-        """Find a tab by its absolute file path. Returns tab_id or None."""
-        abs_path = str(Path(file_path).resolve())
-        for tab_id, editor in self.tabs.items():
-            if editor.file_path:
-                editor_abs_path = str(Path(editor.file_path).resolve())
-                if editor_abs_path == abs_path:
-                    return tab_id
-        return None
+    def find_tab_by_path(self, abs_path: str) -> str | None:
+        """Find a tab by its resolved (realpath) file path. Returns tab_id or None."""
+        return self._path_to_tab.get(abs_path)
+
+    def update_tab_path(self, tab_id: str, file_path: str):
+        """Point the path index at tab_id for file_path (empty path unindexes it)."""
+        old_path = self._tab_paths.pop(tab_id, None)
+        if old_path is not None and self._path_to_tab.get(old_path) == tab_id:
+            del self._path_to_tab[old_path]
+        if file_path:
+            abs_path = os.path.realpath(file_path)
+            self._tab_paths[tab_id] = abs_path
+            self._path_to_tab[abs_path] = tab_id
+
+    def is_tab_dirty(self, tab_id: str) -> bool:
+        """Check if a tab has unsaved changes (unknown tabs count as dirty)."""
+        tab_widget = self.tab_buttons.get(tab_id)
+        return tab_widget is None or not tab_widget.saved
 
     def has_dirty_files(self):
         """Check if any tabs have unsaved changes."""
-        for tab_id in self.tab_order:
-            tab_name = self.tab_bar.query_one(f"#t{tab_id}").label
-            if "*" in tab_name:
+        for tab_widget in self.tab_buttons.values():
+            if "*" in tab_widget.label:
                 return True
         return False
 
@@ -144,6 +199,22 @@ class TabManager(TabNavigationMixin, Container):
         self.session.save_tab_state(tab_paths, active_path)
         logging.info(f"Saved session with {len(tab_paths)} tabs")
 
+    def schedule_save_session(self, delay: float = 0.5):
+        """Save the session once tab changes have settled for `delay` seconds."""
+        self._session_dirty = True
+        if self._session_timer is not None:
+            self._session_timer.stop()
+        self._session_timer = self.set_timer(delay, self.flush_session)
+
+    def flush_session(self):
+        """Write any pending session change to disk now."""
+        if self._session_timer is not None:
+            self._session_timer.stop()
+            self._session_timer = None
+        if self._session_dirty:
+            self._session_dirty = False
+            self.save_session()
+
     # === Tab Operations ===
 
     def on_mount(self):
@@ -163,55 +234,74 @@ class TabManager(TabNavigationMixin, Container):
         # Set up tab order and next_tab_id
         if self.tabs:
             self.tabs = {str(k): v for k, v in self.tabs.items()}
-            self.tab_order = list(self.tabs.keys())
+            self.tab_order = dict.fromkeys(self.tabs)
             self.next_tab_id = len(self.tabs)
             # Set active tab - prefer initial_active_tab_id, else first tab
             if self.initial_active_tab_id and self.initial_active_tab_id in self.tabs:
                 self.active_tab = self.initial_active_tab_id
             else:
-                self.active_tab = self.tab_order[0]
+                self.active_tab = next(iter(self.tab_order))
         else:
             self.active_tab = None
+        self.active_editor = self.tabs.get(self.active_tab) if self.active_tab else None
 
-        # Add all tabs to the tab bar (but don't mount them yet)
+        # An empty-buffer startup has nothing to colour, so skip the repo-wide status
+        if self.repo and any(e.file_path for e in self.tabs.values()):
+            self.refresh_git_status()
+
+        # Build every tab button up front and mount them in a single batch.
+        # Editors aren't mounted yet - only the active one is mounted below.
+        buttons_to_mount = []
         for tab_id, editor in self.tabs.items():
-            self.add_tab(tab_id, editor, first_tabs=True)
+            editor.tab_id = tab_id
+            self.update_tab_path(tab_id, editor.file_path)
+            tab_button = self._build_tab_button(tab_id, editor)
+            self.tab_buttons[tab_id] = tab_button
+            buttons_to_mount.append(tab_button)
+        if buttons_to_mount:
+            self.tab_bar.mount_all(buttons_to_mount)
+        # The batch status is only valid for this pass; git may change later
+        # (saves, git commands, the terminal), so runtime tabs query fresh
+        self._porcelain = None
 
         # Mount only the active editor and mark its tab as selected
         if self.active_tab and self.active_tab in self.tabs:
-            self.mount(self.tabs[self.active_tab])
-            # Enable all tab buttons except the active one
-            for tab_id in self.tabs:
-                tab_btn = self.tab_bar.query_one(f"#t{tab_id}")
-                tab_btn.disabled = (tab_id == self.active_tab)
+            active_editor = self.tabs[self.active_tab]
+            if active_editor.file_path:
+                self.mount(active_editor)
+            else:
+                # Nothing to show yet for an empty buffer, so build its
+                # CodeEditor after the first frame instead of before it
+                self.call_after_refresh(self._mount_deferred_editor, active_editor)
+            self._active_button = self.tab_buttons[self.active_tab]
+            self._active_button.disabled = True
             logging.info(f"Mounted active tab: {self.active_tab}")
 
-    def add_tab(self, tab_id: str, editor: EditorView, first_tabs=False):
-        """Add a new tab with the given editor."""
+    def _mount_deferred_editor(self, editor: EditorView):
+        """Mount an editor whose mount was deferred, unless its tab is gone."""
+        if self.tabs.get(editor.tab_id) is editor and not editor.is_mounted:
+            self.mount(editor)
+
+    def add_tab(self, tab_id: str, editor: EditorView):
+        """Add a new tab with the given editor, mount it and switch to it."""
         logging.info("add_tab thinks its editor should be tab_id: " + tab_id)
         editor.tab_id = tab_id
-        if not first_tabs:
-            logging.info("adding second tab")
         self.tabs.update({tab_id: editor})
+        self.update_tab_path(tab_id, editor.file_path)
         self.add_to_tab_bar(tab_id, editor)
 
-        if first_tabs:
-            # During initial load, don't mount editors - only the active one will be mounted
-            self.tab_bar.query_one(f"#t{tab_id}").disabled = True
-        else:
-            # For new tabs added at runtime, mount and switch to it
-            if not editor.is_mounted:
-                self.mount(editor)
-            tab_widget = self.tab_bar.query_one(f"#t{tab_id}")
-            tab_widget.press()
-            # Scroll to the new tab after layout updates
-            self.call_later(lambda: self.scroll_tab_to_left(tab_widget))
-            # Save session after adding new tab
-            self.call_later(self.save_session)
+        if not editor.is_mounted:
+            self.mount(editor)
+        tab_widget = self.tab_buttons[tab_id]
+        tab_widget.press()
+        # Scroll to the new tab after layout updates
+        self.call_later(lambda: self.scroll_tab_to_left(tab_widget))
+        # Save session after adding new tab
+        self.schedule_save_session()
 
     def switch_tab(self, tab_id: str):
         """Switch to the specified tab."""
-        tab_widget = self.tab_bar.query_one(f"#t{tab_id}")
+        tab_widget = self.tab_buttons[tab_id]
         logging.info("Tab name: " + tab_widget.label)
 
         tab_editor = self.tabs.get(tab_id)
@@ -232,10 +322,13 @@ class TabManager(TabNavigationMixin, Container):
             tab_editor.show()
 
         self.active_tab = tab_id
+        self.active_editor = tab_editor
 
-        for tab in [c for c in self.tab_bar.children if isinstance(c, Button)]:
-            tab.disabled = False
+        # Only the previously selected button and the new one change state
+        if self._active_button is not None and self._active_button is not tab_widget:
+            self._active_button.disabled = False
         tab_widget.disabled = True
+        self._active_button = tab_widget
 
         # Scroll the selected tab to the left
         self.scroll_tab_to_left(tab_widget)
@@ -247,7 +340,7 @@ class TabManager(TabNavigationMixin, Container):
             logging.exception(f"Failed to focus editor for tab {tab_id}")
 
         # Save session after switching tabs
-        self.save_session()
+        self.schedule_save_session()
 
     def scroll_tab_to_left(self, tab_widget):
         """Scroll the tab bar so the given tab is at the left edge."""
@@ -273,27 +366,21 @@ class TabManager(TabNavigationMixin, Container):
             if editor:
                 editor.remove()
 
-        btn = next((b for b in buttons_now if b.id == f"t{tab_id}"), None)
-        if btn:
-            btn.remove()
+        self.remove_from_tab_bar(tab_id)
 
         self.tabs.pop(tab_id, None)
-        try:
-            self.tab_order.remove(tab_id)
-        except ValueError:
-            pass
+        self.tab_order.pop(tab_id, None)
+        self.update_tab_path(tab_id, "")
+        if self.active_tab == tab_id:
+            self.active_editor = None
 
         if next_tab:
             self.switch_tab(next_tab)
-            try:
-                tab_btn = self.tab_bar.query_one(f"#t{next_tab}")
-                tab_btn.disabled = True
-            except Exception:
-                pass
         else:
             self.active_tab = None
+            self.active_editor = None
             # Save session when no next tab (edge case)
-            self.save_session()
+            self.schedule_save_session()
 
     def remove_editor(self, tab_id: str):
         """Remove the editor widget for a tab."""
@@ -306,9 +393,8 @@ class TabManager(TabNavigationMixin, Container):
     def dirty_label(self, tab_id: str):
         """Mark a tab as dirty (unsaved)."""
         logging.info(tab_id)
-        try:
-            tab_widget: Tab = self.tab_bar.query_one(f"#t{tab_id}")
-        except Exception:
+        tab_widget = self.tab_buttons.get(tab_id)
+        if tab_widget is None:
             logging.warning("Could not find tab widget for id %s", tab_id)
             return
         try:
@@ -319,9 +405,8 @@ class TabManager(TabNavigationMixin, Container):
     def save_label(self, tab_id):
         """Mark a tab as saved."""
         logging.info(tab_id)
-        try:
-            tab_widget: Tab = self.tab_bar.query_one(f"#t{tab_id}")
-        except Exception:
+        tab_widget = self.tab_buttons.get(tab_id)
+        if tab_widget is None:
             logging.warning("Could not find tab widget for id %s", tab_id)
             return
         try:
@@ -331,6 +416,10 @@ class TabManager(TabNavigationMixin, Container):
 
     # === Event Handlers ===
 
+    def on_unmount(self):
+        """Don't lose a pending session write on shutdown."""
+        self.flush_session()
+
     def on_button_pressed(self, event: Button.Pressed):
         """Handle tab button press."""
         if "tab_button" in event.button.classes:
@@ -369,9 +458,11 @@ class TabManager(TabNavigationMixin, Container):
         new_editor = EditorView(file_path=message.file_path)
         new_editor.tab_id = active
         self.tabs[active] = new_editor
+        self.update_tab_path(active, message.file_path)
+        self.active_editor = new_editor
 
         try:
-            tab_widget = self.tab_bar.query_one(f"#t{active}")
+            tab_widget = self.tab_buttons.get(active)
             if isinstance(tab_widget, Tab):
                 if message.file_path.startswith("/"):
                     tab_widget.label = self.make_relative(message.file_path)
@@ -391,7 +482,7 @@ class TabManager(TabNavigationMixin, Container):
             new_editor.code_area.focus()
             self.post_message(EditorSaveFile(tab_id=new_editor.tab_id))
             # Save session after file change
-            self.save_session()
+            self.schedule_save_session()
         except Exception:
             logging.exception("Failed mounting new editor for tab %s", active)
 
@@ -420,9 +511,7 @@ class TabManager(TabNavigationMixin, Container):
             # Auto-reload the file - the file watcher already updated mtime
             editor.reload_file()
             # Update the tab label to show it's been refreshed
-            try:
-                tab_widget: Tab = self.tab_bar.query_one(f"#t{message.tab_id}")
+            tab_widget = self.tab_buttons.get(message.tab_id)
+            if tab_widget is not None:
                 tab_widget.save_file()  # Remove dirty indicator if any
-            except Exception:
-                pass
             logging.info(f"Auto-reloaded file: {message.file_path}")
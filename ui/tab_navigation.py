@@ -21,21 +21,22 @@ class TabNavigationMixin:
     def get_next_tab(self, tab_id: str) -> str | None:
         """Get the next tab in order, wrapping to first if at end."""
         logging.info("get_next_tab called with tab_id=%s", tab_id)
-        logging.info("Current tab_order=%s", self.tab_order)
+        logging.info("Current tab_order=%s", list(self.tab_order))
 
         if not self.tab_order:
             logging.info("tab_order empty")
             return None
 
-        try:
-            current_index = self.tab_order.index(tab_id)
-        except ValueError:
+        if tab_id not in self.tab_order:
             logging.info("tab_id not found in tab_order: %s", tab_id)
             return None
 
+        order = list(self.tab_order)
+        current_index = order.index(tab_id)
+
         # Look ahead
-        if current_index + 1 < len(self.tab_order):
-            next_tab = self.tab_order[current_index + 1]
+        if current_index + 1 < len(order):
+            next_tab = order[current_index + 1]
             logging.info("Next tab ahead: %s", next_tab)
             return next_tab
 
@@ -47,14 +48,14 @@ class TabNavigationMixin:
             return lowest_tab
 
         # Fallback: just return the first tab in order
-        fallback_tab = self.tab_order[0]
+        fallback_tab = order[0]
         logging.info("Fallback to first tab in order: %s", fallback_tab)
         return fallback_tab
 
     def get_nearest_tab(self, tab_id: str) -> str | None:
         """Get the nearest tab by numeric distance."""
         logging.info("get_nearest_tab called with tab_id=%s", tab_id)
-        logging.info("Current tab_order=%s", self.tab_order)
+        logging.info("Current tab_order=%s", list(self.tab_order))
 
         if not self.tab_order:
             logging.info("tab_order empty")
@@ -104,7 +105,7 @@ class TabNavigationMixin:
     def get_nearest_tab_after(self, tab_id: str) -> str | None:
         """Get the nearest tab with higher ID, wrapping to lowest if none."""
         logging.info("get_nearest_tab_after called with tab_id=%s", tab_id)
-        logging.info("Current tab_order=%s", self.tab_order)
+        logging.info("Current tab_order=%s", list(self.tab_order))
 
         if not self.tab_order:
             logging.info("tab_order empty")
@@ -142,7 +143,7 @@ class TabNavigationMixin:
     def get_nearest_tab_before(self, tab_id: str) -> str | None:
         """Get the nearest tab with lower ID, wrapping to lowest if none."""
         logging.info("get_nearest_tab_before called with tab_id=%s", tab_id)
-        logging.info("Current tab_order=%s", self.tab_order)
+        logging.info("Current tab_order=%s", list(self.tab_order))
 
         if not self.tab_order:
             logging.info("tab_order empty")
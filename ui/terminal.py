@@ -13,6 +13,12 @@ import pyperclip
 from core.paths import LOG_FILE_STR
 
 logging.basicConfig(filename=LOG_FILE_STR, level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
+# ANSI escape sequences, then any leftover control chars (except \t, \n, \r),
+# compiled once and stripped in a single pass
+_ANSI_RE = re.compile(
+    r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07|\x1b\[.*?[\x40-\x7e]'
+    r'|[\x00-\x08\x0b-\x0c\x0e-\x1f]'
+)
 KEY_CHAR_MAP = {
     "full_stop": ".",
     "slash": "/",
@@ -38,6 +44,15 @@ KEY_CHAR_MAP = {
     "right_parenthesis": ")",
     "quotation_mark": '"'
 }
+# Symbol keys pre-resolved to (char, encoded bytes) so typing doesn't re-encode
+_KEY_BYTES = {k: (v, v.encode()) for k, v in KEY_CHAR_MAP.items()}
+# Arrow keys → escape sequences sent to the shell
+_ARROW = {
+    "up": b"\x1b[A",
+    "down": b"\x1b[B",
+    "left": b"\x1b[D",
+    "right": b"\x1b[C",
+}
 
 class Terminal(TextArea):
     BINDINGS = [
@@ -50,6 +65,12 @@ class Terminal(TextArea):
         self.master_fd = None
         self.process_pid = None
         self.loop = asyncio.get_event_loop()
+
+        # Keystrokes queued for the PTY; flushed in one write per loop tick
+        self._write_buf = bytearray()
+        self._flush_scheduled = False
+        # Set while waiting on the loop for a full PTY to become writable
+        self._writer_registered = False
         
         # Buffer to store ALL shell output
         self.shell_output = ""
@@ -63,10 +84,47 @@ class Terminal(TextArea):
 
     def strip_ansi_codes(self, text: str) -> str:
         """Remove ANSI escape sequences from text"""
-        ansi_pattern = r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07|\x1b\[.*?[\x40-\x7e]'
-        cleaned = re.sub(ansi_pattern, '', text)
-        cleaned = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f]', '', cleaned)
-        return cleaned
+        return _ANSI_RE.sub('', text)
+
+    def _queue_write(self, data: bytes):
+        """Queue bytes for the PTY and schedule a flush on the next loop tick."""
+        self._write_buf.extend(data)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        # A registered writer flushes as soon as the PTY can take more
+        if not self._flush_scheduled and not self._writer_registered:
+            self._flush_scheduled = True
+            self.loop.call_soon(self._flush_writes)
+
+    def _flush_writes(self):
+        """Write all queued bytes to the PTY with a single syscall."""
+        self._flush_scheduled = False
+        if not self._write_buf or not self.master_fd:
+            self._set_writer(False)
+            return
+        try:
+            written = os.write(self.master_fd, self._write_buf)
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            logging.error(f"PTY write failed: {e}")
+            self._write_buf.clear()
+            self._set_writer(False)
+            return
+        del self._write_buf[:written]
+        # PTY buffer was full; write the remainder once it's writable again
+        # rather than retrying every loop tick
+        self._set_writer(bool(self._write_buf))
+
+    def _set_writer(self, wanted: bool):
+        """Register or remove the loop writer that drains a full PTY."""
+        if wanted and not self._writer_registered:
+            self.loop.add_writer(self.master_fd, self._flush_writes)
+            self._writer_registered = True
+        elif not wanted and self._writer_registered:
+            self.loop.remove_writer(self.master_fd)
+            self._writer_registered = False
 
     async def start_shell(self):
         self.master_fd, slave_fd = pty.openpty()
@@ -144,6 +202,52 @@ class Terminal(TextArea):
         self.move_cursor((len(lines) - 1, len(lines[-1])))
         self.read_only = True
 
+    # --- Key handlers, dispatched from on_key via _KEY_HANDLERS ---
+
+    def _handle_enter(self, event: events.Key):
+        self.text += "\n"
+        self._queue_write(b"\n")
+        # Flush right away so the shell runs the command without delay
+        self._flush_writes()
+
+    def _handle_space(self, event: events.Key):
+        self.text += " "
+        self._queue_write(b" ")
+
+    def _handle_backspace(self, event: events.Key):
+        if self.cursor_location[1] <= self.prompt_start_pos+2:
+            logging.info("hitting start_pos")
+            event.prevent_default(True)
+            event.stop()
+            return True
+        # if len(self.text) > self.prompt_start_pos:
+        self.shell_output = self.text[:-1]
+        self.text = self.text[:-1]
+        self._queue_write(b"\x7f")
+
+    def _handle_ctrl_c(self, event: events.Key):
+        self.read_only = True
+        pyperclip.copy(self.selected_text)  # DO NOT TOUCH
+        event.prevent_default()
+        event.stop()
+        return True
+
+    def _handle_ctrl_d(self, event: events.Key):
+        self._queue_write(b"\x04")
+
+    def _handle_tab(self, event: events.Key):
+        self.text += "    "
+        self._queue_write(b"\t")
+
+    _KEY_HANDLERS = {
+        "enter": _handle_enter,
+        "space": _handle_space,
+        "backspace": _handle_backspace,
+        "ctrl+c": _handle_ctrl_c,
+        "ctrl+d": _handle_ctrl_d,
+        "tab": _handle_tab,
+    }
+
     def on_key(self, event: events.Key) -> None:
         if event.key=="ctrl+p":
             return
@@ -158,64 +262,26 @@ class Terminal(TextArea):
         logging.info(f"Key pressed: {repr(key)}")
 
         self.read_only = False
-        # --- ENTER ---
-        if key == "enter":
-            self.text += "\n"
-            os.write(self.master_fd, b"\n")
-
-        # --- SPACE ---
-        elif key == "space":
-            self.text += " "
-            os.write(self.master_fd, b" ")
-
-        # --- BACKSPACE ---
-        elif key == "backspace":
-            if self.cursor_location[1] <= self.prompt_start_pos+2:
-                logging.info("hitting start_pos")
-                event.prevent_default(True)
-                event.stop()
+        handler = self._KEY_HANDLERS.get(key)
+        if handler is not None:
+            # Handlers return True when they've already finished the event
+            if handler(self, event):
                 return
-            # if len(self.text) > self.prompt_start_pos:
-            self.shell_output = self.text[:-1]
-            self.text = self.text[:-1]
-            os.write(self.master_fd, b"\x7f")
-
-        # --- CTRL KEYS ---
-        elif key == "ctrl+c":
-            self.read_only = True
-            pyperclip.copy(self.selected_text)  # DO NOT TOUCH
-            event.prevent_default()
-            event.stop()
-            return
-
-        elif key == "ctrl+d":
-            os.write(self.master_fd, b"\x04")
-
-        # --- TAB ---
-        elif key == "tab":
-            self.text += "    "
-            os.write(self.master_fd, b"\t")
 
         # --- ARROWS ---
-        elif key == "up":
-            os.write(self.master_fd, b"\x1b[A")
-        elif key == "down":
-            os.write(self.master_fd, b"\x1b[B")
-        elif key == "left":
-            os.write(self.master_fd, b"\x1b[D")
-        elif key == "right":
-            os.write(self.master_fd, b"\x1b[C")
+        elif key in _ARROW:
+            self._queue_write(_ARROW[key])
 
         # --- SYMBOLS (Textual key names → chars) ---
-        elif key in KEY_CHAR_MAP:
-            char = KEY_CHAR_MAP[key]
+        elif key in _KEY_BYTES:
+            char, char_bytes = _KEY_BYTES[key]
             self.text += char
-            os.write(self.master_fd, char.encode())
+            self._queue_write(char_bytes)
 
         # --- NORMAL PRINTABLE CHARS ---
         elif len(key) == 1 and key.isprintable():
             self.text += key
-            os.write(self.master_fd, key.encode())
+            self._queue_write(key.encode())
 
         # Move cursor to end
         lines = self.text.split("\n")
@@ -231,7 +297,8 @@ class Terminal(TextArea):
 
     def run_command(self, command: str):
         if self.master_fd:
-            os.write(self.master_fd, (command + "\n").encode())
+            self._queue_write((command + "\n").encode())
+            self._flush_writes()
 
 class TerminalContainer(Container):
     can_focus = True
@@ -1,9 +1,23 @@
 import os
+from functools import cache
 from textual.widgets import TextArea
 from tree_sitter_language_pack import get_language
 from core.paths import HIGHLIGHT_DIR_STR as HIGHLIGHT_DIR
 
 
+@cache
+def load_language(name: str):
+    """Return the tree-sitter Language for name, or None if there's no parser.
+
+    Cached process-wide (including misses), since every editor registers
+    the same languages.
+    """
+    try:
+        return get_language(name)
+    except Exception:
+        return None
+
+
 def register_supported_languages(text_area: TextArea) -> list[str]:
     supported = []
 
@@ -15,9 +29,8 @@ def register_supported_languages(text_area: TextArea) -> list[str]:
         lang = lang.removeprefix("tree-sitter-")
 
         # 1️⃣ Try to load tree-sitter parser
-        try:
-            parser = get_language(lang)
-        except Exception:
+        parser = load_language(lang)
+        if parser is None:
             print(f"[SKIP] {lang}: no tree-sitter parser")
             continue
 
@@ -9,35 +9,77 @@ This module provides the Workspace class which manages:
 
 from textual.containers import Container
 import logging
-from pathlib import Path
 import os
+import asyncio
+from functools import lru_cache
+from collections import defaultdict
 
-from core.paths import LOG_FILE_STR
 from commands.messages import (
     FilePathProvided, WorkspaceNewTab, WorkspaceNextTab, AppNextTab,
     CommandPaletteCommand, OpenCommandPalette, FocusEditor,
     SelectSyntaxEvent, GitCommitMessageSubmitted, LineInputSubmitted, TabMessage,
-    RenameFileProvided, GotoFileLocation
+    RenameFileProvided, GotoFileLocation, EditorSaveFile
 )
 from ui.open_file import OpenFilePopup
 from ui.tab_manager import TabManager
 from ui.editor_view import EditorView
 from ui.command_palette import CommandPalette
 from ui.terminal import Terminal, TerminalContainer
-from ui.success_overlay import SuccessOverlay
 from ui.folder_view import FolderView
 from ui.run_button import RunButtonPressed
+from git import Repo
 from git_utils import get_repo, git_actions
 from workspace.workspace_commands import WorkspaceCommandsMixin
 from core.plugin_manager import PluginManager
 from core.session import Session
-from core.keybindings import get_keybindings_manager
+from core.keybindings import get_keybindings_manager, expand_placeholders
+from core.file_management import save_file
+
+# Logging is configured by the app entrypoint
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=512)
+def _resolve(path: str) -> str:
+    """Resolve a path to an absolute string, caching repeat lookups."""
+    return os.path.realpath(path)
+
+
+# Repo handles keyed on resolved directory, reused across workspace dir changes.
+# Misses aren't cached, so a later `git init` in that directory is picked up.
+_repo_cache: dict[str, Repo] = {}
 
-logging.basicConfig(
-    filename=LOG_FILE_STR,
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+
+def _cached_get_repo(path: str) -> Repo | None:
+    """Return the git repo containing path, reusing handles already opened."""
+    repo = _repo_cache.get(path)
+    if repo is None:
+        repo = get_repo.get_repo(path)
+        if repo is not None:
+            _repo_cache[path] = repo
+    return repo
+
+
+def _existing_paths(paths: list[str]) -> list[str]:
+    """Return the paths that exist, in order, listing each parent dir only once."""
+    by_dir = defaultdict(list)
+    for p in paths:
+        by_dir[os.path.dirname(p)].append(p)
+    names_by_dir = {}
+    for parent in by_dir:
+        try:
+            with os.scandir(parent or ".") as entries:
+                # Dangling symlinks don't count (os.path.exists is False for them)
+                names_by_dir[parent] = {
+                    e.name for e in entries
+                    if not e.is_symlink() or os.path.exists(e.path)
+                }
+        except OSError:
+            # Unlistable dir (e.g. execute-only); check its paths one by one
+            names_by_dir[parent] = {
+                os.path.basename(p) for p in by_dir[parent] if os.path.exists(p)
+            }
+    return [p for p in paths if os.path.basename(p) in names_by_dir[os.path.dirname(p)]]
 
 
 class Workspace(WorkspaceCommandsMixin, Container):
@@ -45,13 +87,24 @@ class Workspace(WorkspaceCommandsMixin, Container):
 
     def __init__(self, folder_view: FolderView | None = None, file_path_passed="", project_root=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.repo = get_repo.get_repo(os.getcwd())
+        self.repo = _cached_get_repo(_resolve(os.getcwd()))
         self.file_path_passed = file_path_passed
         self.folder_view = folder_view
         self.project_root = project_root or os.getcwd()
         self.session = Session(self.project_root)
+        # Sessions already loaded this run, keyed on resolved project root
+        self._sessions: dict[str, Session] = {str(self.session.project_root): self.session}
         self.plugin_manager = PluginManager(app=self)
-        self._init_command_map()
+        # Created on mount / on demand; None until then
+        self.tab_manager = None
+        self.terminal = None
+        self.open_file_popup = None
+        self.command_palette = None
+        # Popups that handle Tab completion, most recently opened last
+        self._tab_completers: list[OpenFilePopup | CommandPalette] = []
+        # Git actions run in worker threads; one at a time so they don't
+        # race on the repo's index lock
+        self._git_lock = asyncio.Lock()
         self._init_keybindings()
 
     def has_got_dirty_files(self):
@@ -66,12 +119,11 @@ class Workspace(WorkspaceCommandsMixin, Container):
 
     def _execute_bash_keybinding(self, command: str):
         """Execute a bash command from a keybinding."""
-        if hasattr(self, 'terminal') and self.terminal:
+        if self.terminal is not None:
             # Replace placeholders
             editor = self.tab_manager.get_active_editor()
             if editor and editor.file_path:
-                command = command.replace("%file%", editor.file_path)
-                command = command.replace("%dir%", str(Path(editor.file_path).parent))
+                command = expand_placeholders(command, editor.file_path)
             self.terminal.run_command(command)
 
     def handle_keybinding(self, key: str) -> bool:
@@ -86,9 +138,9 @@ class Workspace(WorkspaceCommandsMixin, Container):
         Args:
             new_path: The new directory path
         """
-        abs_path = str(Path(new_path).resolve())
+        abs_path = _resolve(new_path)
         if not os.path.isdir(abs_path):
-            logging.warning(f"Cannot change workspace dir to non-directory: {abs_path}")
+            logger.warning("Cannot change workspace dir to non-directory: %s", abs_path)
             return
 
         self.project_root = abs_path
@@ -97,16 +149,19 @@ class Workspace(WorkspaceCommandsMixin, Container):
         if self.folder_view:
             self.folder_view.path = abs_path
 
-        # Update session to use new directory
-        self.session = Session(abs_path)
+        # Update session to use new directory, reusing one already loaded
+        session = self._sessions.get(abs_path)
+        if session is None:
+            session = self._sessions[abs_path] = Session(abs_path)
+        self.session = session
 
         # Update git repo for workspace and tab manager
-        self.repo = get_repo.get_repo(abs_path)
-        if hasattr(self, 'tab_manager') and self.tab_manager:
+        self.repo = _cached_get_repo(abs_path)
+        if self.tab_manager is not None:
             self.tab_manager.repo = self.repo
             self.tab_manager.session = self.session
 
-        logging.info(f"Changed workspace directory to: {abs_path}")
+        logger.info("Changed workspace directory to: %s", abs_path)
 
     def on_mount(self):
         """Initialize workspace components on mount."""
@@ -115,16 +170,18 @@ class Workspace(WorkspaceCommandsMixin, Container):
         active_tab_path = self.session.get_active_tab_path()
 
         # Pre-filter session tabs to only include existing files
-        valid_session_paths = [p for p in session_tabs if os.path.exists(p)]
+        valid_session_paths = _existing_paths(session_tabs)
 
         # Log any removed files
+        valid_set = set(valid_session_paths)
         for p in session_tabs:
-            if p not in valid_session_paths:
-                logging.info(f"Session file no longer exists, skipping: {p}")
+            if p not in valid_set:
+                logger.info("Session file no longer exists, skipping: %s", p)
 
         # Build tabs dict and determine active tab
         tabs = {}
         active_tab_id = None
+        prune_session = False
 
         if self.file_path_passed != "":
             # A specific file was passed as argument - open it
@@ -137,9 +194,9 @@ class Workspace(WorkspaceCommandsMixin, Container):
                 tabs[tab_id] = EditorView(file_path=file_path, classes="editor-view")
                 if file_path == active_tab_path:
                     active_tab_id = tab_id
-            # Clean up session if some files were removed
-            if len(valid_session_paths) < len(session_tabs):
-                self.session.save_tab_state(valid_session_paths, active_tab_path if active_tab_path in valid_session_paths else None)
+            # Clean up session if some files were removed (written once the
+            # tab manager is up, via its debounced session save)
+            prune_session = len(valid_session_paths) < len(session_tabs)
         else:
             # No session, create empty tab
             tabs["0"] = EditorView(file_path="", classes="editor-view")
@@ -152,14 +209,17 @@ class Workspace(WorkspaceCommandsMixin, Container):
             active_tab_id=active_tab_id
         )
         self.mount(self.tab_manager)
+        if prune_session:
+            self.tab_manager.schedule_save_session()
 
         self.terminal = Terminal("/bin/zsh", "> ")
         self.terminal_container = TerminalContainer(terminal=self.terminal)
         self.mount(self.terminal_container)
         self.focus()
 
-        # Load plugins
-        self.plugin_manager.load_all_plugins()
+        # Load plugins after the first paint so they don't delay startup.
+        # Kept on the UI thread since plugin on_enable hooks may touch widgets.
+        self.call_after_refresh(self.plugin_manager.load_all_plugins)
 
     def on_run_button_pressed(self, event: RunButtonPressed):
         """Handle run button press."""
@@ -169,24 +229,25 @@ class Workspace(WorkspaceCommandsMixin, Container):
 
     def new_tab(self, path, tab_id):
         """Create a new tab with the given file path."""
-        logging.info("path: " + path)
-        logging.info("workspace thinks this is tab id: " + str(tab_id))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("new tab %s for path: %s", tab_id, path)
         self.tab_manager.add_tab(tab_id, EditorView(file_path=path))
 
     def on_workspace_new_tab(self, event: WorkspaceNewTab):
         """Handle request to open a new tab."""
         self.open_file_popup = OpenFilePopup(root_dir=self.project_root)
+        self._tab_completers.append(self.open_file_popup)
         self.screen.mount(self.open_file_popup)
 
     def on_app_next_tab(self, event: AppNextTab):
         """Handle request to switch to next tab."""
-        logging.info("message recieved in Workspace")
+        logger.info("message recieved in Workspace")
         self.tab_manager.post_message(WorkspaceNextTab())
 
     def on_file_path_provided(self, event: FilePathProvided):
         """Handle file path provided from open dialog."""
         # Resolve to absolute path for LSP URI compatibility
-        abs_path = str(Path(event.file_path).resolve())
+        abs_path = _resolve(event.file_path)
         # If directory selected, change workspace directory
         if os.path.isdir(abs_path):
             self.change_workspace_dir(abs_path)
@@ -197,26 +258,23 @@ class Workspace(WorkspaceCommandsMixin, Container):
         if existing_tab_id is not None:
             # Switch to existing tab instead of opening a new one
             self.tab_manager.switch_tab(existing_tab_id)
-            logging.info(f"Switched to existing tab for: {abs_path}")
+            logger.info("Switched to existing tab for: %s", abs_path)
             return
 
-        if self.tab_manager.tabs:
-            max_id = max(int(tab_id) for tab_id in self.tab_manager.tabs.keys())
-        else:
-            max_id = -1
-        next_id = str(max_id + 1)
-        prev_file_path = self.tab_manager.get_active_editor().file_path
-        prev_file_editor = self.tab_manager.get_active_editor()
+        next_id = self.tab_manager.get_next_tab_id()
+        prev_file_editor = self.tab_manager.active_editor
+        prev_file_path = prev_file_editor.file_path
         self.new_tab(abs_path, next_id)
         # Replace empty unsaved files with the new file opened
-        if prev_file_path == "" and prev_file_editor.code_area.text.strip() == "":
+        if prev_file_path == "" and prev_file_editor.is_empty:
             self.tab_manager.remove_tab(prev_file_editor.tab_id)
-        logging.info(self.tab_manager.tabs)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Open tabs: %s", list(self.tab_manager.tabs))
 
     def on_rename_file_provided(self, event: RenameFileProvided):
         """Handle file rename request."""
-        old_path = str(Path(event.old_path).resolve())
-        new_path = str(Path(event.new_path).resolve())
+        old_path = _resolve(event.old_path)
+        new_path = _resolve(event.new_path)
 
         # Skip if paths are the same
         if old_path == new_path:
@@ -224,72 +282,66 @@ class Workspace(WorkspaceCommandsMixin, Container):
 
         # Rename the file on disk
         try:
-            # Ensure parent directory exists for new path
-            parent = os.path.dirname(new_path)
-            if parent and not os.path.exists(parent):
-                os.makedirs(parent, exist_ok=True)
-            os.rename(old_path, new_path)
+            # Ensure parent directory exists for new path (skipped for the
+            # common same-directory rename)
+            old_dir = os.path.dirname(old_path)
+            new_dir = os.path.dirname(new_path)
+            if new_dir and old_dir != new_dir and not os.path.isdir(new_dir):
+                os.makedirs(new_dir, exist_ok=True)
+            os.replace(old_path, new_path)
         except OSError as e:
-            logging.error(f"Failed to rename file: {e}")
+            logger.error("Failed to rename file: %s", e)
             return
+        # Cached resolutions may now point at the old location
+        _resolve.cache_clear()
 
         # Update the active editor with the new path
         editor = self.tab_manager.get_active_editor()
         if editor and editor.file_path == old_path:
             editor.file_path = new_path
             editor.code_area.file_path = new_path
+            self.tab_manager.update_tab_path(editor.tab_id, new_path)
 
             # Update the tab label
-            from ui.tab import Tab
-            tab_widget = self.tab_manager.tab_bar.query_one(f"#t{editor.tab_id}")
-            if isinstance(tab_widget, Tab):
+            tab_widget = self.tab_manager.tab_buttons.get(editor.tab_id)
+            if tab_widget is not None:
                 tab_widget.label = self.tab_manager.make_relative(new_path)
 
-        logging.info(f"Renamed file from {old_path} to {new_path}")
+        logger.info("Renamed file from %s to %s", old_path, new_path)
 
     def on_goto_file_location(self, event: GotoFileLocation):
         """Handle request to open file at specific location (for go-to-definition)."""
-        logging.info(f"on_goto_file_location received: file={event.file_path}, line={event.line}, col={event.column}")
-        abs_path = str(Path(event.file_path).resolve())
-        logging.info(f"Resolved absolute path: {abs_path}")
+        abs_path = _resolve(event.file_path)
 
         # Check if file is already open
         existing_tab_id = self.tab_manager.find_tab_by_path(abs_path)
-        logging.info(f"Existing tab id for path: {existing_tab_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("goto file=%s line=%d col=%d existing=%s", abs_path, event.line, event.column, existing_tab_id)
 
         if existing_tab_id is not None:
             # Switch to existing tab
-            logging.info(f"Switching to existing tab: {existing_tab_id}")
             self.tab_manager.switch_tab(existing_tab_id)
         else:
             # Open new tab
-            if self.tab_manager.tabs:
-                max_id = max(int(tab_id) for tab_id in self.tab_manager.tabs.keys())
-            else:
-                max_id = -1
-            next_id = str(max_id + 1)
-            logging.info(f"Opening new tab with id: {next_id}")
+            next_id = self.tab_manager.get_next_tab_id()
             self.new_tab(abs_path, next_id)
 
         # Navigate to position after editor is ready
         def navigate(retries=5):
-            logging.info(f"navigate() callback executing for line={event.line}, col={event.column}, retries left={retries}")
             editor = self.tab_manager.get_active_editor()
             if editor and hasattr(editor, 'code_area') and editor.code_area:
-                logging.info(f"Moving cursor to ({event.line}, {event.column})")
                 editor.code_area.move_cursor((event.line, event.column))
                 editor.code_area.scroll_cursor_visible()
                 editor.code_area.focus()
-                logging.info("Navigation complete")
             elif retries > 0:
                 # Editor not ready yet, retry after a short delay
-                logging.info(f"Editor not ready, scheduling retry ({retries} left)")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Editor not ready, scheduling retry (%d left)", retries)
                 self.set_timer(0.1, lambda: navigate(retries - 1))
             else:
-                logging.warning("Could not get editor or code_area for navigation after retries")
+                logger.warning("Could not get editor or code_area for navigation after retries")
 
         # Use set_timer to give new tab time to mount and initialize
-        logging.info("Scheduling navigate() with set_timer")
         self.set_timer(0.1, navigate)
 
     # === Command Palette ===
@@ -302,6 +354,7 @@ class Workspace(WorkspaceCommandsMixin, Container):
         """Open the command palette."""
         commands = self.get_command_palette_commands()
         self.command_palette = CommandPalette(commands)
+        self._tab_completers.append(self.command_palette)
         self.screen.mount(self.command_palette)
 
     def on_open_command_palette(self, event: OpenCommandPalette):
@@ -312,9 +365,8 @@ class Workspace(WorkspaceCommandsMixin, Container):
 
     def on_focus_editor(self, event: FocusEditor):
         """Handle request to focus the editor."""
-        logging.info("focusing editor")
-        editor = self.tab_manager.get_active_editor()
-        logging.info(editor)
+        editor = self.tab_manager.active_editor
+        logger.info("focusing editor for tab %s", editor.tab_id)
         editor.code_area.focus()
 
     # === Event Handlers ===
@@ -322,59 +374,93 @@ class Workspace(WorkspaceCommandsMixin, Container):
     def on_select_syntax_event(self, event: SelectSyntaxEvent):
         """Handle syntax selection."""
         syntax = event.syntax
-        logging.info("syntax selected: " + syntax)
+        logger.info("syntax selected: %s", syntax)
+        code_area = self.tab_manager.active_editor.code_area
         if event.syntax != "none":
-            self.tab_manager.get_active_editor().code_area.language = syntax
+            code_area.language = syntax
         else:
-            self.tab_manager.get_active_editor().code_area.language = None
-
-    def on_git_commit_message_submitted(self, message: GitCommitMessageSubmitted):
+            code_area.language = None
+
+    async def run_git_action(self, progress_message: str, success_message: str, action, *args):
+        """Run a blocking git action in a thread, showing progress until it finishes."""
+        # Overlays only needed for git actions; imported on first use
+        from ui.progress_overlay import ProgressOverlay
+        from ui.success_overlay import SuccessOverlay
+        progress = ProgressOverlay(progress_message)
+        await self.screen.mount(progress)
+        res = False
+        try:
+            async with self._git_lock:
+                res = await asyncio.to_thread(action, self.repo, *args)
+        finally:
+            # Swap the progress overlay for the result in a single refresh
+            with self.app.batch_update():
+                progress.remove()
+                if res:
+                    self.screen.mount(SuccessOverlay(success_message))
+        return res
+
+    async def on_git_commit_message_submitted(self, message: GitCommitMessageSubmitted):
         """Handle git commit message submission."""
         message_id = message.message_id
         commit_message = message.commit_message
+        message.input_widget.remove()
+        # Run as a worker so the workspace keeps handling messages during a push
         if message_id == "all_3":
-            res = git_actions.git_add_commit_push(self.repo, commit_message)
-            if res:
-                self.screen.mount(SuccessOverlay("Successfully added, commited and pushed all changes."))
+            self.run_worker(self.run_git_action(
+                "Adding, committing and pushing…",
+                "Successfully added, commited and pushed all changes.",
+                git_actions.git_add_commit_push, commit_message
+            ))
         elif message_id == "commit":
-            res = git_actions.git_commit(self.repo, commit_message)
-            if res:
-                self.screen.mount(SuccessOverlay("Successfully committed changes"))
-        message.input_widget.remove()
+            self.run_worker(self.run_git_action(
+                "Committing…",
+                "Successfully committed changes",
+                git_actions.git_commit, commit_message
+            ))
 
     def on_line_input_submitted(self, event: LineInputSubmitted):
         """Handle line number input submission."""
-        num_lines = len(self.tab_manager.get_active_editor().code_area.document.lines)
-        if int(event.line) <= num_lines:
-            self.tab_manager.get_active_editor().code_area.move_cursor((int(event.line) - 1, 0))
+        code_area = self.tab_manager.active_editor.code_area
+        line = int(event.line)
+        num_lines = code_area.document.line_count
+        if line <= num_lines:
+            code_area.move_cursor((line - 1, 0))
         else:
+            from ui.line_input import LineInput
             self.line_input = LineInput(num_lines)
             self.screen.mount(self.line_input)
 
     async def on_tab_message(self, event: TabMessage):
         """Handle custom tab message for auto-completion."""
-        logging.info("recieved custom tab")
-        try:
-            if self.open_file_popup.is_mounted:
-                self.open_file_popup.action_auto_complete()
-        except AttributeError:
-            pass
-        try:
-            if self.command_palette.is_mounted:
-                self.command_palette.action_auto_complete()
-        except AttributeError:
-            pass
-        try:
-            if self.tab_manager.get_active_editor().code_area.has_focus:
-                self.tab_manager.get_active_editor().code_area.post_message(TabMessage(shift=event.shift))
-            else:
-                pass
-        except Exception:
-            pass
-
-    def save_all_files(self):
-        """Save all open files."""
-        for tab in self.tab_manager.tabs.keys():
-            editor = self.tab_manager.tabs[tab]
-            if editor.file_path and hasattr(editor, 'code_area') and editor.code_area:
-                editor.code_area.save_file()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("recieved custom tab")
+        # Drop dismissed popups so Tab reaches whichever one is still open
+        self._tab_completers = [c for c in self._tab_completers if c.is_mounted]
+        if self._tab_completers:
+            self._tab_completers[-1].action_auto_complete()
+            return
+        if self.tab_manager is None:
+            return
+        # The editor's code_area only exists once the EditorView has mounted
+        code_area = getattr(self.tab_manager.active_editor, "code_area", None)
+        if code_area is not None and code_area.has_focus:
+            code_area.post_message(TabMessage(shift=event.shift))
+
+    async def save_all_files(self):
+        """Save all open files, writing them to disk concurrently."""
+        editors = [
+            editor for editor in self.tab_manager.tabs.values()
+            if editor.file_path and getattr(editor, 'code_area', None)
+        ]
+        if not editors:
+            return
+        # Snapshot paths and text on the UI thread; only the disk writes run in the pool
+        paths = [editor.file_path for editor in editors]
+        contents = [editor.code_area.text for editor in editors]
+        await asyncio.gather(*(
+            asyncio.to_thread(save_file, path, text)
+            for path, text in zip(paths, contents)
+        ))
+        for editor in editors:
+            editor.code_area.post_message(EditorSaveFile(editor.code_area.tab_id))
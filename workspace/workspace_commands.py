@@ -5,108 +5,146 @@ from the command palette or keyboard shortcuts.
 """
 
 import logging
-from tree_sitter_language_pack import get_language
-from core.paths import LOG_FILE_STR
-from core.languages import get_run_command
+import os
+from functools import cache
+from types import MappingProxyType
+from core.languages import get_run_command, format_run_command
+from utils.add_languages import load_language
 
 from commands.messages import (
     WorkspaceNewTab, EditorUndo, EditorRedo, WorkspaceRemoveTab, ToggleAIEvent
 )
 from core.ai_config import get_ai_config
-from ui.find_and_replace import FindAndReplace
-from ui.select_syntax import SelectSyntax
-from ui.select_ai import SelectAI
-from ui.api_key_input import APIKeyInput
-from ui.success_overlay import SuccessOverlay
-from ui.line_input import LineInput
-from ui.commit_message import GitCommitMessage
-from ui.rename_file import RenameFilePopup
-from ui.plugins_overlay import PluginsOverlay
-from ui.keybindings_overlay import KeybindingsOverlay
-from ui.python_interpreter_select import PythonInterpreterSelect
 from git_utils import git_actions
 
-logging.basicConfig(
-    filename=LOG_FILE_STR,
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Logging is configured by the app entrypoint
+logger = logging.getLogger(__name__)
+
+
+# Command palette entries: display name -> command name (read-only, shared)
+_PALETTE_COMMANDS = MappingProxyType({
+    "Run File": "run_file",
+    "Open File": "open_file",
+    "Create File": "create_file",
+    "Quit": "quit_app",
+    "Select syntax": "select_syntax",
+    "Git add commit push": "git_add_commit_push",
+    "Git add": "git_add",
+    "Git commit": "git_commit",
+    "Git push": "git_push",
+    "Focus Terminal": "focus_terminal",
+    "Focus Editor": "focus_editor",
+    "Save": "save_file",
+    "Save As": "save_file_as",
+    "Rename File": "rename_file",
+    "Close Current Tab": "close_tab",
+    "Next Tab": "next_tab",
+    "Previous Tab": "previous_tab",
+    "Toggle Sidebar": "toggle_sidebar",
+    "Undo": "undo",
+    "Redo": "redo",
+    "Find": "find",
+    "Go To Line": "go_to_line",
+    "Edit Plugins": "edit_plugins",
+    "Edit Keybindings": "edit_keybindings",
+    "Select AI Provider": "select_ai",
+    "Set API Key": "set_api_key",
+    "Ask AI About Selection": "ask_ai",
+    "Toggle AI Features": "toggle_ai",
+    "Select Python Interpreter": "select_python_interpreter",
+})
+
+
+@cache
+def _probe_languages(names: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the names tree-sitter can actually load (probed once per set of names)."""
+    return tuple(name for name in names if load_language(name) is not None)
 
 
 class WorkspaceCommandsMixin:
     """Mixin providing command implementations for Workspace."""
 
-    def _init_command_map(self):
-        """Initialize the command map. Call from __init__."""
-        self.command_map = {
-            "open_file": self.cmd_open_file,
-            "create_file": self.cmd_create_file,
-            "quit_app": self.cmd_quit_app,
-            "focus_terminal": self.cmd_focus_terminal,
-            "focus_editor": self.cmd_focus_editor,
-            "save_file": self.cmd_save_file,
-            "save_file_as": self.cmd_save_file_as,
-            "rename_file": self.cmd_rename_file,
-            "close_tab": self.cmd_close_tab,
-            "next_tab": self.cmd_next_tab,
-            "previous_tab": self.cmd_previous_tab,
-            "toggle_sidebar": self.cmd_toggle_sidebar,
-            "undo": self.cmd_undo,
-            "redo": self.cmd_redo,
-            "find": self.cmd_find,
-            "go_to_line": self.cmd_go_to_line,
-            "select_syntax": self.cmd_select_syntax,
-            "run_file": self.cmd_run_file,
-            "git_add_commit_push": self.cmd_git_add_commit_push,
-            "git_add": self.cmd_git_add,
-            "git_commit": self.cmd_git_commit,
-            "git_push": self.cmd_git_push,
-            "edit_plugins": self.cmd_edit_plugins,
-            "edit_keybindings": self.cmd_edit_keybindings,
-            "command_palette": self.cmd_command_palette,
-            "select_ai": self.cmd_select_ai,
-            "set_api_key": self.cmd_set_api_key,
-            "ask_ai": self.cmd_ask_ai,
-            "toggle_ai": self.cmd_toggle_ai,
-            "select_python_interpreter": self.cmd_select_python_interpreter
-        }
+    # Commands reachable via dispatch_command; each maps to a cmd_<name> method
+    _COMMAND_NAMES = frozenset({
+        "open_file",
+        "create_file",
+        "quit_app",
+        "focus_terminal",
+        "focus_editor",
+        "save_file",
+        "save_file_as",
+        "rename_file",
+        "close_tab",
+        "next_tab",
+        "previous_tab",
+        "toggle_sidebar",
+        "undo",
+        "redo",
+        "find",
+        "go_to_line",
+        "select_syntax",
+        "run_file",
+        "git_add_commit_push",
+        "git_add",
+        "git_commit",
+        "git_push",
+        "edit_plugins",
+        "edit_keybindings",
+        "command_palette",
+        "select_ai",
+        "set_api_key",
+        "ask_ai",
+        "toggle_ai",
+        "select_python_interpreter",
+    })
+
+    # The app's AIView, looked up on first use (see _ai_view)
+    _ai_view_cached = None
+
+    @property
+    def _ai_view(self):
+        """The app's AI view, or None if the app has none."""
+        view = self._ai_view_cached
+        if view is None:
+            view = self._ai_view_cached = getattr(self.app, 'ai_view', None)
+        return view
 
     def dispatch_command(self, command: str, **kwargs):
         """Dispatch a command by name."""
-        func = self.command_map.get(command)
-        if func:
-            func(**kwargs)
+        if command in self._COMMAND_NAMES:
+            getattr(self, f"cmd_{command}")(**kwargs)
         else:
-            print(f"Unknown command: {command}")
+            logger.warning("Unknown command: %s", command)
 
     # === File Commands ===
 
     def cmd_open_file(self, **kwargs):
         """Open file dialog."""
-        print("Opening file…")
+        logger.debug("Opening file")
         self.post_message(WorkspaceNewTab())
 
     def cmd_create_file(self, **kwargs):
         """Create new file."""
-        print("Creating file…")
+        logger.debug("Creating file")
         self.post_message(WorkspaceNewTab())
 
     def cmd_save_file(self, **kwargs):
         """Save current file."""
-        print("Saving file…")
+        logger.debug("Saving file")
         self.tab_manager.get_active_editor().code_area.save_file()
 
     def cmd_save_file_as(self, **kwargs):
         """Save current file with new name."""
-        print("Saving file as…")
+        logger.debug("Saving file as")
         self.tab_manager.get_active_editor().code_area.save_as()
 
     def cmd_rename_file(self, **kwargs):
         """Rename current file."""
         editor = self.tab_manager.get_active_editor()
         if not editor or not editor.file_path:
-            logging.info("No file to rename")
+            logger.info("No file to rename")
             return
+        from ui.rename_file import RenameFilePopup
         self.screen.mount(RenameFilePopup(current_path=editor.file_path))
 
     # === Tab Commands ===
@@ -121,77 +159,75 @@ class WorkspaceCommandsMixin:
 
     def cmd_previous_tab(self, **kwargs):
         """Switch to previous tab."""
-        print("Switching to previous tab…")
+        logger.debug("Switching to previous tab")
         self.tab_manager.previous_tab(self.tab_manager.active_tab)
 
     # === Focus Commands ===
 
     def cmd_focus_terminal(self, **kwargs):
         """Focus the terminal."""
-        print("Focusing terminal…")
+        logger.debug("Focusing terminal")
         self.terminal.focus()
 
     def cmd_focus_editor(self, **kwargs):
         """Focus the editor."""
-        print("Focusing editor…")
+        logger.debug("Focusing editor")
         self.tab_manager.get_active_editor().code_area.focus()
 
     # === Edit Commands ===
 
     def cmd_undo(self, **kwargs):
         """Undo last action."""
-        print("Undo…")
+        logger.debug("Undo")
         self.tab_manager.post_message(EditorUndo())
 
     def cmd_redo(self, **kwargs):
         """Redo last undone action."""
-        print("Redo…")
+        logger.debug("Redo")
         self.tab_manager.post_message(EditorRedo())
 
     def cmd_find(self, **kwargs):
         """Open find and replace."""
-        print("Find…")
+        logger.debug("Find")
         self.find_and_replace(self.tab_manager.get_active_editor())
 
     def cmd_go_to_line(self, **kwargs):
         """Go to specific line number."""
-        num_lines = len(self.tab_manager.get_active_editor().code_area.document.lines)
+        num_lines = self.tab_manager.get_active_editor().code_area.document.line_count
+        from ui.line_input import LineInput
         self.screen.mount(LineInput(num_lines))
 
     def cmd_select_syntax(self, **kwargs):
         """Open syntax selection dialog."""
-        logging.info("Selecting syntax")
-        syntaxes = list(self.tab_manager.get_active_editor().code_area.available_languages)
-        logging.info(len(syntaxes))
-        available = ["none"]  # Add none option to disable syntax highlighting
-        for name in syntaxes:
-            try:
-                get_language(name)
-                available.append(name)
-            except Exception:
-                pass
+        logger.info("Selecting syntax")
+        syntaxes = tuple(sorted(self.tab_manager.get_active_editor().code_area.available_languages))
+        logger.debug("%d syntaxes to probe", len(syntaxes))
+        # Add none option to disable syntax highlighting
+        available = ["none", *_probe_languages(syntaxes)]
 
+        from ui.select_syntax import SelectSyntax
         self.screen.mount(SelectSyntax(available))
 
     def cmd_run_file(self, **kwargs):
         """Run the current file in the terminal."""
         editor = self.tab_manager.get_active_editor()
         if not editor or not editor.file_path:
-            logging.info("No file to run")
+            logger.info("No file to run")
             return
 
-        # Save file first
-        editor.code_area.save_file()
+        # Save file first, unless the buffer already matches the disk
+        if self.tab_manager.is_tab_dirty(editor.tab_id):
+            editor.code_area.save_file()
 
         # Get run command for this file type
         run_cmd = get_run_command(editor.file_path)
         if not run_cmd:
-            logging.info(f"No run command for: {editor.file_path}")
+            logger.info("No run command for: %s", editor.file_path)
             return
 
         # Replace {file} placeholder with actual path
-        cmd = run_cmd.format(file=editor.file_path)
-        logging.info(f"Running: {cmd}")
+        cmd = format_run_command(run_cmd, editor.file_path)
+        logger.info("Running: %s", cmd)
 
         # Send command to terminal
         self.terminal.run_command(cmd)
@@ -207,8 +243,8 @@ class WorkspaceCommandsMixin:
 
     def cmd_quit_app(self, **kwargs):
         """Quit the application."""
-        print("Quitting app…")
-        quit()
+        logger.debug("Quitting app")
+        self.app.exit()
 
     # === Git Commands ===
 
@@ -218,9 +254,11 @@ class WorkspaceCommandsMixin:
 
     def cmd_git_add(self, **kwargs):
         """Stage all changes."""
-        res = git_actions.git_add(self.repo)
-        if res:
-            self.screen.mount(SuccessOverlay("Successfully staged all files"))
+        self.run_worker(self.run_git_action(
+            "Staging…",
+            "Successfully staged all files",
+            git_actions.git_add
+        ))
 
     def cmd_git_commit(self, **kwargs):
         """Open commit message dialog."""
@@ -228,67 +266,71 @@ class WorkspaceCommandsMixin:
 
     def cmd_git_push(self, **kwargs):
         """Push to remote."""
-        res = git_actions.git_push_origin_main(self.repo)
-        if res:
-            self.screen.mount(SuccessOverlay("Successfully pushed commit to branch main"))
+        self.run_worker(self.run_git_action(
+            "Pushing…",
+            "Successfully pushed commit to branch main",
+            git_actions.git_push_origin_main
+        ))
 
     def show_commit_input(self, id="commit"):
         """Show the commit message input dialog."""
+        from ui.commit_message import GitCommitMessage
         self.screen.mount(GitCommitMessage(message_id=id))
 
     # === Plugin Commands ===
 
     def cmd_edit_plugins(self, **kwargs):
         """Open the plugins management overlay."""
+        from ui.plugins_overlay import PluginsOverlay
         self.screen.mount(PluginsOverlay(plugin_manager=self.plugin_manager))
 
     def cmd_edit_keybindings(self, **kwargs):
         """Open the keybindings editor overlay."""
+        from ui.keybindings_overlay import KeybindingsOverlay
         self.screen.mount(KeybindingsOverlay())
 
     def cmd_select_ai(self, **kwargs):
         """Open AI provider selection dialog."""
-        logging.info("Selecting AI provider")
+        logger.info("Selecting AI provider")
         # Get AI view from app
-        if hasattr(self.app, 'ai_view') and self.app.ai_view.ai_chat:
-            ai_chat = self.app.ai_view.ai_chat
+        ai_view = self._ai_view
+        if ai_view and ai_view.ai_chat:
+            ai_chat = ai_view.ai_chat
             providers = ai_chat.get_available_providers()
             current = ai_chat.get_current_provider_name()
+            from ui.select_ai import SelectAI
             self.screen.mount(SelectAI(providers, current))
 
     def cmd_set_api_key(self, **kwargs):
         """Open API key input dialog."""
-        logging.info("Opening API key input")
+        logger.info("Opening API key input")
+        from ui.api_key_input import APIKeyInput
         self.screen.mount(APIKeyInput())
 
     def cmd_ask_ai(self, **kwargs):
         """Send current selection to AI."""
-        logging.info("Sending selection to AI")
-        if hasattr(self.app, 'ai_view') and self.app.ai_view:
+        logger.info("Sending selection to AI")
+        ai_view = self._ai_view
+        if ai_view:
             # Get selected text from editor
             editor = self.tab_manager.get_active_editor()
             if editor and hasattr(editor, 'code_area') and editor.code_area:
                 selected = getattr(editor.code_area, 'selected_text', '')
                 if selected:
-                    self.app.ai_view.ask_about_code(selected)
+                    ai_view.ask_about_code(selected)
                 else:
-                    self.app.ai_view.ask_about_code(editor.code_area.text, is_full_file=True)
+                    ai_view.ask_about_code(editor.code_area.text, is_full_file=True)
 
     def cmd_toggle_ai(self, **kwargs):
         """Toggle AI features on/off."""
-        logging.info("=== cmd_toggle_ai called ===")
         ai_config = get_ai_config()
-        current_state = ai_config.is_ai_enabled()
-        logging.info(f"Current AI enabled state: {current_state}")
-        new_state = not current_state
-        logging.info(f"New AI enabled state: {new_state}")
+        new_state = not ai_config.is_ai_enabled()
         ai_config.set_ai_enabled(new_state)
         # Directly toggle the AI view visibility
-        if hasattr(self.app, 'ai_view') and self.app.ai_view:
-            new_display = "block" if new_state else "none"
-            logging.info(f"Setting ai_view display to: {new_display}")
-            self.app.ai_view.styles.display = new_display
-            logging.info(f"ai_view display is now: {self.app.ai_view.styles.display}")
+        ai_view = self._ai_view
+        if ai_view:
+            ai_view.styles.display = "block" if new_state else "none"
+        logger.info("AI toggled %s", "on" if new_state else "off")
 
     def cmd_command_palette(self, **kwargs):
         """Open the command palette."""
@@ -296,51 +338,22 @@ class WorkspaceCommandsMixin:
 
     def cmd_select_python_interpreter(self, **kwargs):
         """Open Python interpreter selection dialog."""
-        logging.info("Selecting Python interpreter")
+        logger.info("Selecting Python interpreter")
         # Get working directory from current file
         editor = self.tab_manager.get_active_editor()
         working_dir = None
         if editor and editor.file_path:
-            from pathlib import Path
-            working_dir = str(Path(editor.file_path).parent)
+            working_dir = os.path.dirname(editor.file_path) or "."
+        from ui.python_interpreter_select import PythonInterpreterSelect
         self.screen.mount(PythonInterpreterSelect(working_dir=working_dir))
 
     # === Helper Methods ===
 
     def find_and_replace(self, editor):
         """Open find and replace for the given editor."""
+        from ui.find_and_replace import FindAndReplace
         self.mount(FindAndReplace(editor=editor))
 
     def get_command_palette_commands(self):
         """Return the command palette command definitions."""
-        return {
-            "Run File": "run_file",
-            "Open File": "open_file",
-            "Create File": "create_file",
-            "Quit": "quit_app",
-            "Select syntax": "select_syntax",
-            "Git add commit push": "git_add_commit_push",
-            "Git add": "git_add",
-            "Git commit": "git_commit",
-            "Git push": "git_push",
-            "Focus Terminal": "focus_terminal",
-            "Focus Editor": "focus_editor",
-            "Save": "save_file",
-            "Save As": "save_file_as",
-            "Rename File": "rename_file",
-            "Close Current Tab": "close_tab",
-            "Next Tab": "next_tab",
-            "Previous Tab": "previous_tab",
-            "Toggle Sidebar": "toggle_sidebar",
-            "Undo": "undo",
-            "Redo": "redo",
-            "Find": "find",
-            "Go To Line": "go_to_line",
-            "Edit Plugins": "edit_plugins",
-            "Edit Keybindings": "edit_keybindings",
-            "Select AI Provider": "select_ai",
-            "Set API Key": "set_api_key",
-            "Ask AI About Selection": "ask_ai",
-            "Toggle AI Features": "toggle_ai",
-            "Select Python Interpreter": "select_python_interpreter",
-        }
+        return _PALETTE_COMMANDS